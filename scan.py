@@ -7,7 +7,9 @@
 """
 
 import argparse
-import json
+import asyncio
+import errno
+import mmap
 import os
 import platform
 import re
@@ -15,15 +17,83 @@ import socket
 import struct
 import subprocess
 
+# orjson is optional, the standard json module is used without it
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Receive buffer for the multicast sockets, fits about 1 second of a 10 Mb/s MPEG-TS burst.
+# The kernel clamps it to net.core.rmem_max, raise it with: sysctl -w net.core.rmem_max=12582912
+UDP_RCVBUF_SIZE = 12 * 1024 * 1024
+
+# The socket module exposes IP_PKTINFO only on newer Python versions, 8 is its Linux value
+IP_PKTINFO = getattr(socket, 'IP_PKTINFO', 8)
+
+# The same for IP_MULTICAST_ALL, 49 is its Linux value
+IP_MULTICAST_ALL = getattr(socket, 'IP_MULTICAST_ALL', 49)
+
+# struct ip_mreq for joining the multicast groups
+MREQ_STRUCT = struct.Struct('4sl')
+
+# Channel name line followed by the channel address line of the playlist
+CHANNEL_RE = re.compile(rb'#EXTINF:-1,([^\r\n]*)\r?\nudp://@([^:\r\n]+):([0-9]+)')
+
+# Service name in the ffprobe output, values with escaped characters are left to the JSON parser
+SERVICE_NAME_RE = re.compile(rb'"service_name"\s*:\s*"([^"\\]*)"')
+
+# Maximum number of datagrams read from a socket on one wake up of the event loop
+UDP_RECV_BATCH = 64
+
+
+def positive_int(value):
+    """ Argument type for the positive integers
+    :param value: argument string
+    :return: integer
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive number')
+    return number
+
+
 parser = argparse.ArgumentParser(description='Script to check the IPTV UDP streams from m3u playlist')
-parser.add_argument("--port", help="additional UDP port to scan. Default: 1234", required=False, default=1234)
+parser.add_argument("--port", help="additional UDP port to scan. Default: 1234", type=int, required=False, default=1234)
 parser.add_argument("--ip", help="additional IP to scan. Default: 239.1.1.10", required=False, default='239.1.1.10')
-parser.add_argument("--info_timeout", help="Time to wait in seconds for the stream's info", required=False, default=10)
-parser.add_argument("--udp_timeout", help="Time to wait in seconds for the UPD port reply", required=False, default=10)
+parser.add_argument("--info_timeout", help="Time to wait in seconds for the stream's info", type=float, required=False,
+                    default=10)
+parser.add_argument("--udp_timeout", help="Time to wait in seconds for the UPD port reply", type=float, required=False,
+                    default=10)
+parser.add_argument("--fast_timeout", help="Time to wait in seconds for the UDP port reply before the scan "
+                                         "of the answered streams starts", type=float, required=False, default=0.25)
 parser.add_argument("--playlist", help="Playlist *.m3u file with UDP streams", required=False)
+parser.add_argument("--numa", help="Pin the scan to the CPUs of the NUMA node of the default route interface",
+                    action='store_true')
+parser.add_argument("--workers", help="Maximum number of ffprobe processes running at the same time. "
+                                    "Default: number of CPUs the scan runs on", type=positive_int, required=False)
+
+
+# Running or finished ffprobe tasks: (address, port, info_timeout) -> task with the channel name
+ffprobe_cache = {}
+
+
+async def get_ffprobe(address, port, info_timeout):
+    """ To get the channel name from ip:port
+    The task is cached, so a stream is probed only once, even by concurrent callers
+    :param address: stream ip address
+    :param port: connection port
+    :param info_timeout: Time to wait in seconds
+    :return: channel name
+    """
+    key = (address, port, info_timeout)
+    task = ffprobe_cache.get(key)
+    # A cancelled probe is started again
+    if task is None or task.cancelled():
+        task = ffprobe_cache[key] = asyncio.ensure_future(run_ffprobe(address, port, info_timeout))
+    return await task
 
 
-def get_ffprobe(address, port, info_timeout):
+async def run_ffprobe(address, port, info_timeout):
     """ To get the json data from ip:port
     :param address: stream ip address
     :param port: connection port
@@ -31,40 +101,175 @@ def get_ffprobe(address, port, info_timeout):
     :return: channel name
     """
 
-    # Run the ffprobe with given IP and PORT with a given timeout to execute
+    # Run the ffprobe with given IP and PORT with a given timeout to execute.
+    # Only the service name is requested. The default probe size is kept, as the name comes from
+    # the SDT table that is repeated only every 2 seconds, the info_timeout bounds the wait
     try:
         # Capture the output from ffprobe
-        result = subprocess.run(
-            ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_programs', f'udp://@{address}:{port}'],
-            capture_output=True, text=True, timeout=info_timeout)
-        # Convert the STDOUT to JSON
-        json_string = json.loads(str(result.stdout))
+        process = await asyncio.create_subprocess_exec(
+            'ffprobe', '-v', 'quiet',
+            '-print_format', 'json=compact=1', '-show_entries', 'program_tags=service_name',
+            '-i', f'udp://@{address}:{port}',
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), info_timeout)
+        except asyncio.TimeoutError:
+            # Do not leave the ffprobe process behind
+            process.kill()
+            await process.wait()
+            raise
     except Exception:
         print(f'[*] No data found for {address}:{port}')
         return 0
-    # Parse the JSON "PROGRAMS" section
-
-    for program in json_string['programs']:
-        # Parse the JSON "STEAMS" section
-        for stream in program['streams']:
-            # Check the stream via index data
-            try:
-                # Check the stream's channel name
+
+    # Check the stream's channel name
+    match = SERVICE_NAME_RE.search(stdout)
+    if match:
+        service_name = match.group(1).decode('utf-8', 'replace')
+    else:
+        try:
+            # Convert the STDOUT to JSON
+            json_string = json_loads(stdout)
+        except Exception:
+            print(f'[*] No data found for {address}:{port}')
+            return 0
+
+        # Check the first program of the stream
+        programs = json_string.get('programs')
+        if not programs:
+            print(f'[*] No stream found for {address}:{port}')
+            return 0
+        service_name = programs[0].get('tags', {}).get('service_name')
+
+    if service_name:
+        return service_name
+    print(f'[*] !!! No channel name found for {address}:{port} !!!')
+    return 1
+
+
+class MulticastProbe:
+    """ Join the UDP multicast groups and wait for their first datagrams.
+    One socket is bound for every unique port and all groups of the port are joined on it,
+    the received datagrams are matched to the groups by their destination address
+    """
+
+    def __init__(self, ips, ports):
+        """
+        :param ips: List of the streams ip addresses
+        :param ports: List of the streams ports, parallel to the ips
+        """
+        # Sockets of every port
+        self.sockets = {}
+        # Groups without a datagram yet: (group address, port) -> ((ip, port), socket, mreq)
+        self.pending = {}
+        try:
+            for port in udp_ports_parser(ports):
+                self.sockets[port] = [self._open_socket(port)]
+            for ipaddr, port in set(zip(ips, ports)):
+                self._join(ipaddr, port)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _open_socket(port):
+        """ Open the socket bound to the given port
+        :param port: connection port
+        :return: socket
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        # Receive the destination (group) address of every datagram
+        sock.setsockopt(socket.IPPROTO_IP, IP_PKTINFO, 1)
+        # Receive only the groups joined on this socket, not the groups of other processes like ffprobe
+        sock.setsockopt(socket.IPPROTO_IP, IP_MULTICAST_ALL, 0)
+        sock.bind(('', port))
+        return sock
+
+    def _join(self, ipaddr, port):
+        """ Join the group on the socket of its port
+        :param ipaddr: stream ip address
+        :param port: connection port
+        """
+        group = socket.inet_aton(ipaddr)
+        mreq = MREQ_STRUCT.pack(group, socket.INADDR_ANY)
+        sock = self.sockets[port][-1]
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        except OSError as error:
+            # The kernel limits the groups per socket (net.ipv4.igmp_max_memberships), open one more
+            if error.errno != errno.ENOBUFS:
+                raise
+            sock = self._open_socket(port)
+            self.sockets[port].append(sock)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        self.pending[(group, port)] = ((ipaddr, port), sock, mreq)
+
+    async def wait(self, timeout=None, on_live=None):
+        """ Wait for the datagrams of the joined groups, a group is left after its first datagram
+        :param timeout: time to wait in seconds
+        :param on_live: function called with every live stream as soon as its first datagram arrives
+        :return: Set of the live streams like (239.0.0.1, 1234)
+        """
+        loop = asyncio.get_running_loop()
+        live = set()
+        finished = loop.create_future()
+
+        def on_readable(sock, port):
+            # Read all queued datagrams at once, up to the batch size to not hold up the other sockets
+            for _ in range(UDP_RECV_BATCH):
                 try:
-                    if program['tags']['service_name'] != '':
-                        return program['tags']['service_name']
-                    else:
-                        print(f'[*] !!! No channel name found for {address}:{port} !!!')
-                        return 1
-                except Exception:
-                    print(f'[*] !!! No channel name found for {address}:{port} !!!')
-                    return 1
-            except Exception:
-                print(f'[*] No stream found for {address}:{port}')
-                return 0
-
-
-def check_udp_connectivity(url, timeout=None):
+                    # Only one byte of the datagram is copied, the group comes with the ancillary data
+                    _, ancdata, _, _ = sock.recvmsg(1, socket.CMSG_SPACE(12))
+                except BlockingIOError:
+                    break
+                for level, kind, data in ancdata:
+                    if level != socket.IPPROTO_IP or kind != IP_PKTINFO:
+                        continue
+                    # struct in_pktinfo: interface index, local address, destination address
+                    pending = self.pending.pop((data[8:12], port), None)
+                    if pending:
+                        stream, group_sock, mreq = pending
+                        group_sock.setsockopt(socket.IPPROTO_IP, socket.IP_DROP_MEMBERSHIP, mreq)
+                        live.add(stream)
+                        if on_live:
+                            on_live(stream)
+            if not self.pending and not finished.done():
+                finished.set_result(None)
+
+        sockets = [(sock, port) for port, port_sockets in self.sockets.items() for sock in port_sockets]
+        for sock, port in sockets:
+            sock.setblocking(False)
+            loop.add_reader(sock, on_readable, sock, port)
+        try:
+            if self.pending:
+                await asyncio.wait_for(finished, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for sock, _ in sockets:
+                loop.remove_reader(sock)
+        return live
+
+    def close(self):
+        """ Close the sockets, which also leaves the groups still joined
+        """
+        for sockets in self.sockets.values():
+            for sock in sockets:
+                sock.close()
+        self.sockets = {}
+        self.pending = {}
+
+
+async def check_udp_connectivity(url, timeout=None):
     """
     Trying to wake up udp thread
     :param url: IP address and port like 239.0.0.1:1234
@@ -72,64 +277,91 @@ def check_udp_connectivity(url, timeout=None):
     :return: True or False
     """
     ipaddr, port = url.rsplit(':', 1)
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-    sock.settimeout(timeout)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-    sock.bind(('', int(port)))
-    mreq = struct.pack('4sl', socket.inet_aton(ipaddr), socket.INADDR_ANY)
-    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-    try:
-        if sock.recv(10240):
-            return True
-    except socket.timeout:
-        pass
-    return False
+    with MulticastProbe([ipaddr], [int(port)]) as probe:
+        return (ipaddr, int(port)) in await probe.wait(timeout)
 
 
-def playlist_parser(playlist):
-    """ Function that returns a dictionary of UDP streams
-    :param playlist: Full path to the playlist
-    :return: Dictionary of UDP streams
+def check_udp_rcvbuf():
+    """ Check that the kernel allows the UDP receive buffer size
+    :return: True or False
     """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+        # Linux doubles the granted size for its bookkeeping, anything below the doubled request was clamped
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 2 * UDP_RCVBUF_SIZE
 
-    # Defining regular expression for strings
-    channel_name_re = re.compile(r'(?<=#EXTINF:-1,)(.*)(?=$)')
-    channel_address_re = re.compile(r'(?<=@)(.*)(?=$)')
 
-    # Create a dictionary
-    dictionary = {}
-
-    # Open the playlist file and write the data to the dictionary
-    with open(playlist) as playlist:
-        for counter, line in enumerate(playlist):
-            if re.findall(channel_name_re, line):
-                channel_name = re.search(channel_name_re, line).group()
-                channel_address = re.search(channel_address_re, playlist.readline()).group()
-                dictionary[channel_name] = channel_address
-
-    return dictionary
-
-
-def udp_ports_parser(channels):
-    """ Function to get the list of the unique ports from the UDP channels dictionary
-    :param channels: Dictionary of UDP streams
-    :return: List of the unique ports
+def default_route_interface():
+    """ Function to get the network interface of the default route
+    :return: Interface name or None
     """
+    try:
+        with open('/proc/net/route') as file:
+            # Skip the header line
+            next(file, None)
+            for line in file:
+                fields = line.split()
+                # The default route has the 0.0.0.0 destination
+                if len(fields) > 1 and fields[1] == '00000000':
+                    return fields[0]
+    except OSError:
+        pass
+    return None
 
-    # Get the unique values of UDP channel:port lines
-    upd_channels_ports = set(channels.values())
 
-    # Get the list of UDP ports
-    port_list = []
-    for item in upd_channels_ports:
-        port = item.split(':')[1]
-        port_list.append(port)
+def numa_node_cpus(interface):
+    """ Function to get the CPUs of the NUMA node the network interface is attached to
+    :param interface: Network interface name
+    :return: Set of the CPUs, empty if the node is unknown
+    """
+    try:
+        with open(f'/sys/class/net/{interface}/device/numa_node') as file:
+            node = int(file.read())
+        # -1 means the host has no NUMA or the device is virtual
+        if node < 0:
+            return set()
+        with open(f'/sys/devices/system/node/node{node}/cpulist') as file:
+            cpulist = file.read().strip()
+
+        # Parse the CPU list like 0-7,16-23, it is empty for a node without CPUs
+        cpus = set()
+        for item in filter(None, cpulist.split(',')):
+            first, _, last = item.partition('-')
+            cpus.update(range(int(first), int(last or first) + 1))
+    except (OSError, ValueError):
+        return set()
+    return cpus
 
-    # Get the unique list of UDP ports
-    port_list = set(port_list)
 
-    return port_list
+def playlist_parser(playlist):
+    """ Function that returns the UDP streams as parallel lists
+    :param playlist: Full path to the playlist
+    :return: Lists of the channel names, ip addresses and ports
+    """
+    names, ips, ports = [], [], []
+
+    # Map the playlist file to memory and write the data to the lists in one pass,
+    # only the matched names and addresses are decoded
+    with open(playlist, 'rb') as file:
+        # An empty file can not be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return names, ips, ports
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in CHANNEL_RE.finditer(data):
+                # The names are informational, a playlist in another encoding must not stop the scan
+                names.append(match.group(1).decode('utf-8', 'replace'))
+                ips.append(match.group(2).decode('utf-8'))
+                ports.append(int(match.group(3)))
+
+    return names, ips, ports
+
+
+def udp_ports_parser(ports):
+    """ Function to get the unique ports of the UDP streams
+    :param ports: List of the streams ports
+    :return: Set of the unique ports
+    """
+    return set(ports)
 
 
 def create_file(playlist):
@@ -145,19 +377,15 @@ def create_file(playlist):
     playlistfilename = f'{playlist.rsplit(".", 1)[0]}_name.m3u'
     playlistfile = os.path.join(currentpath, playlistfilename)
 
-    # Open the playlist file and add the first line (header)
-    with open(playlistfile, 'w') as file:
-        file.write('#EXTM3U\n')
-
     return playlistfilename, playlistfile
 
 
-def playlist_add(ip, port, name, playlistfile):
-    """ Add the given IP and port to the playlist file
+def playlist_add(ip, port, name, lines):
+    """ Add the given IP and port to the playlist lines
     :param ip: stream ip address
     :param port: Connection port
     :param name: Channel name
-    :param playlistfile: full path to playlist file
+    :param lines: list of the playlist lines
     """
 
     # Check the name variable
@@ -166,28 +394,22 @@ def playlist_add(ip, port, name, playlistfile):
     else:
         channel_string = f'#EXTINF:-1,{name}\n'
 
-    # Open the file
-    with open(playlistfile, 'a') as file:
-
-        # Add the channel name line
-        file.write(channel_string)
-
-        # Add the channel address
-        file.write(f'udp://@{ip}:{port}\n')
+    # Add the channel name line and the channel address
+    lines.append(f'{channel_string}udp://@{ip}:{port}\n')
 
 
 # If the playlist argument is specified
-def action_playlist(playlist, info_timeout, udp_timeout):
+async def action_playlist(playlist, info_timeout, udp_timeout, fast_timeout, workers):
     """ Parce playlist file and check ip:port and create new playlist
     :param playlist: playlist file
     :param info_timeout: time to wait in seconds for get INFO
-    :param udp_timeout: time to wait in seconds for get UDP
+    :param udp_timeout: time to wait in seconds for get UDP of the streams silent after the fast_timeout
+    :param fast_timeout: time to wait in seconds for get UDP before the scan starts
+    :param workers: maximum number of ffprobe processes running at the same time, None for the number of CPUs
     """
     # Create a resulting playlist file:
     playlistfilename, playlistfile = create_file(playlist)
 
-    channels_dictionary = []
-
     # Check the input playlist file
     if not os.path.isfile(playlist):
         print('[*] Please specify the correct file!')
@@ -195,33 +417,71 @@ def action_playlist(playlist, info_timeout, udp_timeout):
     else:
         print(f'[*] Playlist file: {playlist}')
 
-    # Get the dictionary of UDP channels
-    channels_dictionary = playlist_parser(playlist)
+    # Get the UDP channels
+    _, ips, ports = playlist_parser(playlist)
+
+    # Limit the number of ffprobe processes running at the same time,
+    # by default to the CPUs the scan runs on (after the --numa pinning)
+    ffprobe_slots = asyncio.Semaphore(workers or len(os.sched_getaffinity(0)))
+
+    async def scan_one(ipaddr, port):
+        async with ffprobe_slots:
+            info = await get_ffprobe(ipaddr, port, info_timeout)
+        return ipaddr, port, info
+
+    # Trying to wake up the udp threads of all channels at once.
+    # The same stream is scanned only once, even if it is listed under several names
+    scans = []
+
+    def start_scan(stream):
+        scans.append(asyncio.ensure_future(scan_one(*stream)))
+
+    with MulticastProbe(ips, ports) as probe:
+        # Live streams answer quickly, their scan starts as soon as they answer
+        await probe.wait(fast_timeout, start_scan)
 
-    for k, v in channels_dictionary.items():
-        ipaddr, port = v.rsplit(':', 1)
+        # Wait longer only for the silent streams, they are not scanned if they stay silent
+        if probe.pending:
+            await probe.wait(udp_timeout, start_scan)
+        silent = [stream for stream, _, _ in probe.pending.values()]
 
-        # Trying to wake up the udp thread
-        check_udp_connectivity(v, udp_timeout)
-        info = get_ffprobe(ipaddr, port, info_timeout)
+    # Channel names of the streams, filled in as the scans finish
+    results = {}
+
+    for ipaddr, port in silent:
+        print(f'[*] No UDP data found for {ipaddr}:{port}')
+        print(f'{ipaddr}:{port} - {ipaddr}')
+        results[(ipaddr, port)] = ipaddr
+
+    for scan in asyncio.as_completed(scans):
+        ipaddr, port, info = await scan
         if type(info) is int:
-            print(v + ' - ' + ipaddr)
-            playlist_add(ipaddr, port, ipaddr, playlistfile)
+            print(f'{ipaddr}:{port} - {ipaddr}')
+            results[(ipaddr, port)] = ipaddr
         else:
-            print(v + ' - ' + info)
-            playlist_add(ipaddr, port, info, playlistfile)
+            print(f'{ipaddr}:{port} - {info}')
+            results[(ipaddr, port)] = info
+
+    # Collect the playlist lines in the order of the input playlist, starting with the first line (header)
+    lines = ['#EXTM3U\n']
+    for ipaddr, port in dict.fromkeys(zip(ips, ports)):
+        playlist_add(ipaddr, port, results[(ipaddr, port)], lines)
+
+    # Write the playlist file at once
+    with open(playlistfile, 'w') as file:
+        file.write(''.join(lines))
 
 
 # Single IP and PORT check
-def action_ip_port(ip, port, info_timeout, udp_timeout):
+async def action_ip_port(ip, port, info_timeout, udp_timeout):
     """ Single IP and PORT check
     :param ip: IP multicast stream
     :param port: PORT multicast stream
     :param info_timeout: time to wait in seconds for get INFO
     :param udp_timeout: time to wait in seconds for get UDP
     """
-    check_udp_connectivity(ip+':'+str(port), udp_timeout)
-    info = get_ffprobe(ip, port, info_timeout)
+    await check_udp_connectivity(ip+':'+str(port), udp_timeout)
+    info = await get_ffprobe(ip, port, info_timeout)
     if type(info) is int:
         print(ip+':'+str(port) + ' - ' + ip)
     else:
@@ -250,13 +510,29 @@ def main():
         print('[*] ffprobe are not installed! Please install first: https://ffmpeg.org/')
         exit()
 
+    # Check the UDP receive buffer limit
+    if not check_udp_rcvbuf():
+        print(f'[*] UDP receive buffer is limited by the kernel, streams may look dead. '
+              f'Please raise it first: sysctl -w net.core.rmem_max={UDP_RCVBUF_SIZE}')
+
+    # Run the scan and the ffprobe processes on the NUMA node of the network interface
+    if args.numa:
+        interface = default_route_interface()
+        cpus = numa_node_cpus(interface) & os.sched_getaffinity(0) if interface else set()
+        if cpus:
+            os.sched_setaffinity(0, cpus)
+            print(f'[*] Pinned to the CPUs {sorted(cpus)} of the {interface} NUMA node')
+        else:
+            print('[*] NUMA node of the network interface not found, the CPUs are not pinned')
+
     # Single IP and PORT check
     if args.ip and args.port:
-        action_ip_port(args.ip, args.port, args.info_timeout, args.udp_timeout)
+        asyncio.run(action_ip_port(args.ip, args.port, args.info_timeout, args.udp_timeout))
 
     # If the playlist argument is specified
     if args.playlist:
-        action_playlist(args.playlist, args.info_timeout, args.udp_timeout)
+        asyncio.run(action_playlist(args.playlist, args.info_timeout, args.udp_timeout, args.fast_timeout,
+                                    args.workers))
 
 
 if __name__ == "__main__":